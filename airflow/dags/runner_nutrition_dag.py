@@ -7,13 +7,15 @@ loading to Snowflake, transforming with dbt, and generating insights.
 Schedule: Daily at 2:00 AM UTC
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from airflow import DAG
 from airflow.operators.python import PythonOperator
 from airflow.operators.bash import BashOperator
-from airflow.utils.dates import days_ago
 import os
 import logging
+import tempfile
 
 # =====================================================================
 # DEFAULT ARGS
@@ -27,6 +29,10 @@ default_args = {
     'retries': 2,
     'retry_delay': timedelta(minutes=5),
     'retry_exponential_backoff': True,
+    'max_retry_delay': timedelta(minutes=30),
+    # Favour finishing runs already in flight over starting new ones,
+    # so a backfill fan-out doesn't starve the daily run's later tasks
+    'weight_rule': 'upstream',
 }
 
 # =====================================================================
@@ -37,10 +43,12 @@ dag = DAG(
     'runner_nutrition_pipeline',
     default_args=default_args,
     description='Daily runner nutrition analytics pipeline',
-    schedule_interval='0 2 * * *',
-    start_date=days_ago(1),
+    schedule='0 2 * * *',
+    start_date=datetime(2026, 1, 1),
     catchup=False,
     max_active_runs=1,
+    max_active_tasks=4,
+    dagrun_timeout=timedelta(hours=2),
     tags=['nutrition', 'youtube', 'snowflake', 'dbt'],
 )
 
@@ -53,24 +61,54 @@ USDA_API_KEY     = os.environ.get('USDA_API_KEY')
 DBT_PROJECT_DIR  = os.environ.get('DBT_PROJECT_DIR',  '/opt/airflow/dbt/runner_nutrition')
 DBT_PROFILES_DIR = os.environ.get('DBT_PROFILES_DIR', '/opt/airflow/dbt')
 
-FOOD_KEYWORDS = [
-    'carb', 'carbs', 'carbohydrate', 'protein', 'fat', 'banana',
-    'oatmeal', 'pasta', 'rice', 'egg', 'chicken', 'gel', 'energy gel',
-    'bar', 'protein bar', 'coffee', 'sports drink', 'hydration',
-    'yogurt', 'milk', 'sweet potato', 'quinoa', 'salmon', 'avocado',
-    'nuts', 'berries', 'bread', 'bagel', 'smoothie', 'fruit'
+# Airflow pools capping concurrency at the upstream system's limit
+# (created in airflow-init, see docker-compose.yml)
+YOUTUBE_POOL   = 'youtube_api'
+SNOWFLAKE_POOL = 'snowflake_etl'
+
+YOUTUBE_MAX_IDS_PER_CALL    = 50
+YOUTUBE_MAX_CALLS_PER_BATCH = 50
+
+SEARCH_QUERIES = [
+    'runner nutrition food',
+    'marathon nutrition',
+    'running diet',
+    'ultramarathon fueling',
+    'what runners eat'
 ]
 
+# =====================================================================
+# RETRY HELPER
+# =====================================================================
+
+def api_retrying(*exception_types):
+    """
+    Tenacity retrier for upstream (YouTube / Snowflake) calls.
+    Randomized exponential backoff capped at 60s, so callers that hit
+    the same 429 or outage don't retry in lockstep; up to 5 attempts.
+    """
+    from tenacity import (
+        Retrying, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+    )
+
+    return Retrying(
+        wait=wait_random_exponential(multiplier=1, max=60),
+        retry=retry_if_exception_type(exception_types),
+        stop=stop_after_attempt(5),
+        reraise=True,
+    )
+
+
 # =====================================================================
 # SNOWFLAKE CONNECTION HELPER (PEM KEY AUTH)
 # =====================================================================
 
-def get_snowflake_connection():
+@lru_cache(maxsize=None)
+def get_snowflake_private_key():
     """
-    Create Snowflake connection using PEM private key (no password).
-    Key is mounted into Docker container at /opt/airflow/secrets/snowflake_key.pem
+    Load the PEM private key and return it as DER bytes.
+    Cached so the key is read and parsed once per worker process.
     """
-    import snowflake.connector
     from cryptography.hazmat.primitives import serialization
 
     key_path = os.environ.get('PRIVATE_KEY_PATH', '/opt/airflow/secrets/snowflake_key.pem')
@@ -81,16 +119,26 @@ def get_snowflake_connection():
             password=None  # Key is not encrypted
         )
 
-    private_key_bytes = private_key.private_bytes(
+    return private_key.private_bytes(
         encoding=serialization.Encoding.DER,
         format=serialization.PrivateFormat.PKCS8,
         encryption_algorithm=serialization.NoEncryption()
     )
 
-    return snowflake.connector.connect(
+
+def get_snowflake_connection():
+    """
+    Create Snowflake connection using PEM private key (no password).
+    Key is mounted into Docker container at /opt/airflow/secrets/snowflake_key.pem
+    """
+    import snowflake.connector
+    from snowflake.connector.errors import OperationalError
+
+    return api_retrying(OperationalError)(
+        snowflake.connector.connect,
         account=os.environ.get('SNOWFLAKE_ACCOUNT'),
         user=os.environ.get('SNOWFLAKE_USER'),
-        private_key=private_key_bytes,
+        private_key=get_snowflake_private_key(),
         warehouse=os.environ.get('SNOWFLAKE_WAREHOUSE'),
         database=os.environ.get('SNOWFLAKE_DATABASE', 'DATAEXPERT_STUDENT'),
         schema=os.environ.get('SNOWFLAKE_SCHEMA', 'BOLISETTYAAKASH693240'),
@@ -98,93 +146,198 @@ def get_snowflake_connection():
 
 
 # =====================================================================
-# TASK 1: EXTRACT YOUTUBE VIDEOS
+# YOUTUBE API HELPERS
 # =====================================================================
 
-def extract_youtube(**context):
+def build_youtube_client():
     """
-    Extract YouTube videos published since last run.
-    Uses MAX(published_at) from Snowflake for incremental extraction.
+    Build a YouTube Data API client from the discovery document bundled
+    with google-api-python-client, so no discovery HTTPS call is made.
     """
     from googleapiclient.discovery import build
 
-    logging.info("Starting YouTube extraction...")
+    return build(
+        'youtube', 'v3',
+        developerKey=YOUTUBE_API_KEY,
+        static_discovery=True,
+        cache_discovery=False,
+    )
 
-    # Get last processed date for incremental loading
-    conn = get_snowflake_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        SELECT COALESCE(
-            MAX(published_at),
-            DATEADD(day, -7, CURRENT_TIMESTAMP())
-        )
-        FROM raw_youtube_videos
-    """)
-    last_date = cursor.fetchone()[0]
-    cursor.close()
-    conn.close()
 
-    published_after = last_date.strftime('%Y-%m-%dT%H:%M:%SZ')
-    logging.info(f"Fetching videos published after: {published_after}")
+def execute_youtube_request(request):
+    """
+    Execute a googleapiclient request (or batch request), retrying
+    HTTP errors (e.g. 429s).
+    """
+    from googleapiclient.errors import HttpError
 
-    # YouTube API
-    youtube = build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
+    return api_retrying(HttpError)(request.execute)
 
-    SEARCH_QUERIES = [
-        'runner nutrition food',
-        'marathon nutrition',
-        'running diet',
-        'ultramarathon fueling',
-        'what runners eat'
-    ]
 
-    all_videos = []
+def search_youtube(query, published_after):
+    """
+    Run a single YouTube search query and return the matching video ids.
+    Only ids are requested; snippets are fetched later by hydrate_videos.
+    Builds its own client because googleapiclient's httplib2 transport
+    is not thread-safe. A query that still fails after retries is
+    logged and skipped.
+    """
+    youtube = build_youtube_client()
+
+    try:
+        response = execute_youtube_request(youtube.search().list(
+            part='id',
+            fields='items(id/videoId)',
+            q=query,
+            type='video',
+            publishedAfter=published_after,
+            maxResults=50,
+            relevanceLanguage='en'
+        ))
+    except Exception as e:
+        logging.error(f"Error fetching query '{query}': {e}")
+        return []
+
+    return [item['id']['videoId'] for item in response.get('items', [])]
 
-    for query in SEARCH_QUERIES:
-        try:
-            response = youtube.search().list(
-                part='snippet',
-                q=query,
-                type='video',
-                publishedAfter=published_after,
-                maxResults=50,
-                relevanceLanguage='en'
-            ).execute()
-
-            for item in response.get('items', []):
-                title       = item['snippet']['title'].lower()
-                description = item['snippet'].get('description', '').lower()
-                text        = title + ' ' + description
-
-                mentioned_foods = [f for f in FOOD_KEYWORDS if f in text]
-
-                if mentioned_foods:
-                    all_videos.append({
-                        'video_id':        item['id']['videoId'],
-                        'title':           item['snippet']['title'],
-                        'description':     item['snippet'].get('description', ''),
-                        'channel_title':   item['snippet']['channelTitle'],
-                        'published_at':    item['snippet']['publishedAt'][:19].replace('T', ' '),
-                        'url':             f"https://youtube.com/watch?v={item['id']['videoId']}",
-                        'mentioned_foods': ','.join(mentioned_foods),
-                        'year':            int(item['snippet']['publishedAt'][:4])
-                    })
 
+def hydrate_videos(video_ids):
+    """
+    Fetch snippets for video_ids with videos.list, 50 ids per call.
+    The calls go out together as one HTTP batch request, so hydration
+    costs a single round trip. A call that fails is logged and skipped.
+    Returns {video_id: snippet}, in the order of video_ids.
+    """
+    youtube  = build_youtube_client()
+    snippets = {}
+
+    def collect(request_id, response, exception):
+        if exception is not None:
+            logging.error(f"Error hydrating video chunk {request_id}: {exception}")
+            return
+        for item in response.get('items', []):
+            snippets[item['id']] = item['snippet']
+
+    chunks = [
+        video_ids[i:i + YOUTUBE_MAX_IDS_PER_CALL]
+        for i in range(0, len(video_ids), YOUTUBE_MAX_IDS_PER_CALL)
+    ]
+
+    for i in range(0, len(chunks), YOUTUBE_MAX_CALLS_PER_BATCH):
+        batch = youtube.new_batch_http_request(callback=collect)
+        for chunk in chunks[i:i + YOUTUBE_MAX_CALLS_PER_BATCH]:
+            batch.add(youtube.videos().list(
+                part='snippet',
+                fields='items(id,snippet(title,description,channelTitle,publishedAt))',
+                id=','.join(chunk),
+                maxResults=YOUTUBE_MAX_IDS_PER_CALL
+            ))
+        try:
+            execute_youtube_request(batch)
         except Exception as e:
-            logging.error(f"Error fetching query '{query}': {e}")
-            continue
+            logging.error(f"Error executing hydration batch: {e}")
+
+    return {vid: snippets[vid] for vid in video_ids if vid in snippets}
+
+
+# =====================================================================
+# BRONZE STAGE HELPER
+# =====================================================================
+
+def stage_videos(cursor, videos, stage_path):
+    """
+    Write videos to a snappy Parquet file and PUT it to a Snowflake stage.
+    The batch is handed between tasks through the stage, so only the
+    stage path goes through XCom / the Airflow metadata DB.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    batch = pa.Table.from_pydict({
+        'video_id':      [v['video_id']            for v in videos],
+        'title':         [v['title'][:500]         for v in videos],
+        'description':   [v['description'][:5000]  for v in videos],
+        'channel_title': [v['channel_title'][:200] for v in videos],
+        'published_at':  [v['published_at']        for v in videos],
+        'url':           [v['url']                 for v in videos],
+        'year':          [v['year']                for v in videos],
+    })
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        local_file = os.path.join(tmp_dir, 'bronze.parquet')
+        pq.write_table(batch, local_file, compression='snappy')
+        cursor.execute(
+            f"PUT file://{local_file} {stage_path} "
+            f"AUTO_COMPRESS=FALSE OVERWRITE=TRUE"
+        )
+
+
+# =====================================================================
+# TASK 1: EXTRACT YOUTUBE VIDEOS
+# =====================================================================
+
+def extract_youtube(**context):
+    """
+    Extract YouTube videos published since last run.
+    Uses the previous successful run's data interval end for incremental
+    extraction (7 days back on the first run).
+    Stages the batch on the raw_youtube_videos table stage for load_bronze.
+    """
+    logging.info("Starting YouTube extraction...")
+
+    # Incremental window starts where the last successful run's data
+    # interval ended; Airflow tracks this, so no warehouse query is needed
+    last_date = (
+        context['prev_data_interval_end_success']
+        or context['data_interval_end'] - timedelta(days=7)
+    )
+
+    published_after = last_date.in_timezone('UTC').strftime('%Y-%m-%dT%H:%M:%SZ')
+    logging.info(f"Fetching videos published after: {published_after}")
 
-    # Deduplicate by video_id
-    seen = set()
+    # Fan the independent search calls out across threads
+    with ThreadPoolExecutor(max_workers=len(SEARCH_QUERIES)) as executor:
+        responses = list(executor.map(
+            lambda query: search_youtube(query, published_after),
+            SEARCH_QUERIES
+        ))
+
+    # Deduplicate by video_id across queries, then fetch each snippet once
+    video_ids = list(dict.fromkeys(vid for ids in responses for vid in ids))
+    snippets  = hydrate_videos(video_ids)
+
+    # Food keyword matching happens in Snowflake (stg_youtube_videos),
+    # so every hydrated video is staged as-is
     unique_videos = []
-    for v in all_videos:
-        if v['video_id'] not in seen:
-            seen.add(v['video_id'])
-            unique_videos.append(v)
+
+    for video_id, snippet in snippets.items():
+        published = snippet['publishedAt']
+
+        unique_videos.append({
+            'video_id':      video_id,
+            'title':         snippet['title'],
+            'description':   snippet.get('description', ''),
+            'channel_title': snippet['channelTitle'],
+            'published_at':  published[:19].replace('T', ' '),
+            'url':           f"https://youtube.com/watch?v={video_id}",
+            'year':          int(published[:4])
+        })
 
     logging.info(f"Found {len(unique_videos)} new unique videos")
 
-    context['ti'].xcom_push(key='videos',      value=unique_videos)
+    stage_path = None
+    if unique_videos:
+        stage_path = f"@%raw_youtube_videos/bronze/{context['ts_nodash']}"
+
+        conn   = get_snowflake_connection()
+        cursor = conn.cursor()
+        stage_videos(cursor, unique_videos, stage_path)
+        cursor.close()
+        conn.close()
+
+        logging.info(f"Staged videos at {stage_path}")
+
+    context['ti'].xcom_push(key='stage_path',  value=stage_path)
     context['ti'].xcom_push(key='video_count', value=len(unique_videos))
 
     return len(unique_videos)
@@ -196,144 +349,85 @@ def extract_youtube(**context):
 
 def load_bronze(**context):
     """
-    Idempotent load to raw_youtube_videos using MERGE.
-    Skips videos already in stg_processed_videos.
+    Idempotent load to raw_youtube_videos using a single batched MERGE.
+    COPYs the Parquet batch staged by extract_youtube into a temp table,
+    then merges the videos not already in raw_youtube_videos.
     """
-    videos = context['ti'].xcom_pull(key='videos', task_ids='extract_youtube')
+    stage_path = context['ti'].xcom_pull(key='stage_path', task_ids='extract_youtube')
 
-    if not videos:
+    if not stage_path:
         logging.info("No new videos to load. Skipping.")
         return 0
 
-    logging.info(f"Loading {len(videos)} videos to Snowflake...")
+    logging.info(f"Loading videos from {stage_path} to Snowflake...")
 
     conn   = get_snowflake_connection()
     cursor = conn.cursor()
 
-    # Idempotency check
-    video_ids    = [v['video_id'] for v in videos]
-    placeholders = ','.join(['%s'] * len(video_ids))
-    cursor.execute(
-        f"SELECT video_id FROM stg_processed_videos WHERE video_id IN ({placeholders})",
-        video_ids
-    )
-    existing_ids = {row[0] for row in cursor.fetchall()}
-    new_videos   = [v for v in videos if v['video_id'] not in existing_ids]
+    cursor.execute("""
+        CREATE TEMPORARY TABLE stg_bronze_batch
+        LIKE raw_youtube_videos
+    """)
+    cursor.execute(f"""
+        COPY INTO stg_bronze_batch
+        FROM {stage_path}
+        FILE_FORMAT = (TYPE = PARQUET)
+        MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE
+    """)
 
-    if not new_videos:
-        logging.info("All videos already processed. Idempotency check passed.")
-        conn.close()
-        return 0
+    # The MERGE alone makes the load idempotent; the source is deduped
+    # by video_id so a repeated id can't insert twice
+    cursor.execute("""
+        MERGE INTO raw_youtube_videos AS target
+        USING (
+            SELECT * FROM stg_bronze_batch
+            QUALIFY ROW_NUMBER() OVER (
+                PARTITION BY video_id
+                ORDER BY published_at DESC
+            ) = 1
+        ) AS source
+        ON target.video_id = source.video_id
+        WHEN NOT MATCHED THEN
+            INSERT (video_id, title, description, channel_title,
+                    published_at, url, year)
+            VALUES (source.video_id, source.title, source.description,
+                    source.channel_title, source.published_at, source.url,
+                    source.year)
+    """)
+    inserted = cursor.fetchone()[0]
 
-    logging.info(f"Inserting {len(new_videos)} new videos...")
-
-    for video in new_videos:
-        # MERGE into raw_youtube_videos
-        cursor.execute("""
-            MERGE INTO raw_youtube_videos AS target
-            USING (SELECT %s AS video_id) AS source
-            ON target.video_id = source.video_id
-            WHEN NOT MATCHED THEN
-                INSERT (video_id, title, description, channel_title,
-                        published_at, url, mentioned_foods, year)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        """, (
-            video['video_id'],
-            video['video_id'],
-            video['title'][:500],
-            video['description'][:5000],
-            video['channel_title'][:200],
-            video['published_at'],
-            video['url'],
-            video['mentioned_foods'],
-            video['year']
-        ))
+    conn.commit()
 
-        # Track as processed
-        cursor.execute("""
-            INSERT INTO stg_processed_videos (video_id, processing_status)
-            VALUES (%s, 'SUCCESS')
-        """, (video['video_id'],))
+    # Drop the staged file only once the load is committed, so a retry
+    # of this task can COPY it again
+    cursor.execute(f"REMOVE {stage_path}")
 
-    conn.commit()
     cursor.close()
     conn.close()
 
-    logging.info(f"Successfully loaded {len(new_videos)} videos")
-    return len(new_videos)
+    if not inserted:
+        logging.info("All videos already loaded. Idempotency check passed.")
+        return 0
+
+    logging.info(f"Successfully loaded {inserted} videos")
+    return inserted
 
 
 # =====================================================================
-# TASKS 3-8: DBT TRANSFORMATIONS
+# TASK 3: DBT BUILD
 # =====================================================================
 
-
-dbt_stg = BashOperator(
-    task_id='dbt_stg',
+# One dbt process runs and tests every node upstream of the mart in DAG
+# order, and runs independent nodes (e.g. dim_foods / dim_channels) in
+# parallel across the profile's threads
+dbt_build = BashOperator(
+    task_id='dbt_build',
+    pool=SNOWFLAKE_POOL,
     bash_command=f"""
         cd {DBT_PROJECT_DIR} && \
-        dbt run \
-            --profiles-dir {DBT_PROFILES_DIR} \
-            --select stg_youtube_videos \
-            --no-version-check
-    """,
-    dag=dag,
-)
-
-dbt_int = BashOperator(
-    task_id='dbt_int',
-    bash_command=f"""
-        cd {DBT_PROJECT_DIR} && \
-        dbt run \
-            --profiles-dir {DBT_PROFILES_DIR} \
-            --select int_food_mentions \
-            --no-version-check
-    """,
-    dag=dag,
-)
-
-dbt_dimensions = BashOperator(
-    task_id='dbt_dimensions',
-    bash_command=f"""
-        cd {DBT_PROJECT_DIR} && \
-        dbt run \
-            --profiles-dir {DBT_PROFILES_DIR} \
-            --select dim_foods dim_channels \
-            --no-version-check
-    """,
-    dag=dag,
-)
-
-dbt_fact = BashOperator(
-    task_id='dbt_fact',
-    bash_command=f"""
-        cd {DBT_PROJECT_DIR} && \
-        dbt run \
-            --profiles-dir {DBT_PROFILES_DIR} \
-            --select fact_video_food_mentions \
-            --no-version-check
-    """,
-    dag=dag,
-)
-
-dbt_mart = BashOperator(
-    task_id='dbt_mart',
-    bash_command=f"""
-        cd {DBT_PROJECT_DIR} && \
-        dbt run \
-            --profiles-dir {DBT_PROFILES_DIR} \
-            --select mart_food_analysis \
-            --no-version-check
-    """,
-    dag=dag,
-)
-
-dbt_test = BashOperator(
-    task_id='dbt_test',
-    bash_command=f"""
-        cd {DBT_PROJECT_DIR} && \
-        dbt test \
+        dbt build \
             --profiles-dir {DBT_PROFILES_DIR} \
+            --select +mart_food_analysis \
             --no-version-check
     """,
     dag=dag,
@@ -341,41 +435,59 @@ dbt_test = BashOperator(
 
 
 # =====================================================================
-# TASK 7: GENERATE INSIGHTS
+# TASK 4: GENERATE INSIGHTS
 # =====================================================================
 
 def generate_insights(**context):
     """
     Run analytical queries and log key insights.
     """
+    import pyarrow.compute as pc
+
     logging.info("Generating insights...")
 
     conn   = get_snowflake_connection()
     cursor = conn.cursor()
 
-    # Top 5 foods
+    # Top 5 foods + pipeline stats in a single result set; the LEFT JOIN
+    # keeps the stats row even when the mart is empty
     cursor.execute("""
-        SELECT food_name, video_mention_count, usda_protein_g, usda_calories
-        FROM DATAEXPERT_STUDENT.BOLISETTYAAKASH693240.mart_food_analysis
-        ORDER BY mention_rank
-        LIMIT 5
+        WITH stats AS (
+            SELECT
+                (SELECT COUNT(*) FROM raw_youtube_videos)       AS total_videos,
+                (SELECT COUNT(*) FROM fact_video_food_mentions) AS total_mentions
+        ),
+
+        top_foods AS (
+            SELECT food_name, video_mention_count, usda_protein_g, usda_calories, mention_rank
+            FROM DATAEXPERT_STUDENT.BOLISETTYAAKASH693240.mart_food_analysis
+            ORDER BY mention_rank
+            LIMIT 5
+        )
+
+        SELECT
+            t.food_name, t.video_mention_count, t.usda_protein_g, t.usda_calories,
+            s.total_videos, s.total_mentions
+        FROM stats s
+        LEFT JOIN top_foods t ON TRUE
+        ORDER BY t.mention_rank
     """)
-    top_foods = cursor.fetchall()
+    # Arrow result format skips per-row Python tuple construction
+    results = cursor.fetch_arrow_all()
+
+    stats     = results.slice(0, 1).to_pylist()[0]
+    top_foods = results.filter(pc.is_valid(results['FOOD_NAME']))
+
+    total_videos   = stats['TOTAL_VIDEOS']
+    total_mentions = stats['TOTAL_MENTIONS']
 
     logging.info("=== TOP 5 RUNNER NUTRITION FOODS ===")
-    for rank, row in enumerate(top_foods, 1):
+    for rank, row in enumerate(top_foods.to_pylist(), 1):
         logging.info(
-            f"#{rank} {row[0]}: {row[1]} videos | "
-            f"Protein: {row[2]}g | Calories: {row[3]}"
+            f"#{rank} {row['FOOD_NAME']}: {row['VIDEO_MENTION_COUNT']} videos | "
+            f"Protein: {row['USDA_PROTEIN_G']}g | Calories: {row['USDA_CALORIES']}"
         )
 
-    # Pipeline stats
-    cursor.execute("SELECT COUNT(*) FROM raw_youtube_videos")
-    total_videos = cursor.fetchone()[0]
-
-    cursor.execute("SELECT COUNT(*) FROM fact_video_food_mentions")
-    total_mentions = cursor.fetchone()[0]
-
     logging.info("=== PIPELINE STATS ===")
     logging.info(f"Total videos:   {total_videos}")
     logging.info(f"Total mentions: {total_mentions}")
@@ -384,13 +496,13 @@ def generate_insights(**context):
     conn.close()
 
     context['ti'].xcom_push(key='total_videos', value=total_videos)
-    context['ti'].xcom_push(key='top_foods',    value=[r[0] for r in top_foods])
+    context['ti'].xcom_push(key='top_foods',    value=top_foods.column('FOOD_NAME').to_pylist())
 
     return total_videos
 
 
 # =====================================================================
-# TASK 8: PIPELINE SUMMARY
+# TASK 5: PIPELINE SUMMARY
 # =====================================================================
 
 def pipeline_summary(**context):
@@ -417,22 +529,25 @@ def pipeline_summary(**context):
 t1_extract = PythonOperator(
     task_id='extract_youtube',
     python_callable=extract_youtube,
+    pool=YOUTUBE_POOL,
     dag=dag,
 )
 
 t2_load = PythonOperator(
     task_id='load_bronze',
     python_callable=load_bronze,
+    pool=SNOWFLAKE_POOL,
     dag=dag,
 )
 
-t7_insights = PythonOperator(
+t4_insights = PythonOperator(
     task_id='generate_insights',
     python_callable=generate_insights,
+    pool=SNOWFLAKE_POOL,
     dag=dag,
 )
 
-t8_summary = PythonOperator(
+t5_summary = PythonOperator(
     task_id='pipeline_summary',
     python_callable=pipeline_summary,
     dag=dag,
@@ -446,20 +561,10 @@ t8_summary = PythonOperator(
 #       ↓
 # load_bronze
 #       ↓
-# dbt_stg
-#       ↓
-# dbt_int
-#       ↓
-# dbt_dimensions
-#       ↓
-# dbt_fact
-#       ↓
-# dbt_mart
-#       ↓
-# dbt_test
+# dbt_build  (stg → int → dims → fact → mart, with tests)
 #       ↓
 # generate_insights
 #       ↓
 # pipeline_summary
 
-t1_extract >> t2_load >> dbt_stg >> dbt_int >> dbt_dimensions >> dbt_fact >> dbt_mart >> dbt_test >> t7_insights >> t8_summary
\ No newline at end of file
+t1_extract >> t2_load >> dbt_build >> t4_insights >> t5_summary
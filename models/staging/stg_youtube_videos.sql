@@ -1,4 +1,6 @@
 -- Staging model: Clean and transform raw YouTube videos
+-- Food keywords are matched here against title + description; videos
+-- without any mention are dropped
 
 {{
     config(
@@ -8,29 +10,44 @@
 
 WITH source AS (
     SELECT * FROM {{ source('raw', 'raw_youtube_videos') }}
+    WHERE title IS NOT NULL
+      AND published_at IS NOT NULL
+),
+
+food_keywords AS (
+    SELECT LOWER(keyword) AS keyword FROM {{ ref('food_keywords') }}
+),
+
+food_matches AS (
+    SELECT
+        s.video_id,
+        ARRAY_AGG(k.keyword) WITHIN GROUP (ORDER BY k.keyword) AS extracted_foods
+    FROM source s
+    INNER JOIN food_keywords k
+        ON CONTAINS(LOWER(s.title || ' ' || COALESCE(s.description, '')), k.keyword)
+    GROUP BY s.video_id
 ),
 
 cleaned AS (
     SELECT
-        video_id,
-        TRIM(title) AS title_clean,
-        TRIM(description) AS description_clean,
-        TRIM(channel_title) AS channel_title_clean,
-        published_at,
-        TO_DATE(published_at) AS published_date,
-        YEAR(published_at) AS year,
-        QUARTER(published_at) AS quarter,
-        MONTH(published_at) AS month,
-        MONTHNAME(published_at) AS month_name,
-        DAYOFWEEK(published_at) AS day_of_week,
-        url,
-        -- Split comma-separated foods into array
-        SPLIT(mentioned_foods, ',') AS extracted_foods,
-        year AS year_int,
-        loaded_at
-    FROM source
-    WHERE title IS NOT NULL
-      AND published_at IS NOT NULL
+        s.video_id,
+        TRIM(s.title) AS title_clean,
+        TRIM(s.description) AS description_clean,
+        TRIM(s.channel_title) AS channel_title_clean,
+        s.published_at,
+        TO_DATE(s.published_at) AS published_date,
+        YEAR(s.published_at) AS year,
+        QUARTER(s.published_at) AS quarter,
+        MONTH(s.published_at) AS month,
+        MONTHNAME(s.published_at) AS month_name,
+        DAYOFWEEK(s.published_at) AS day_of_week,
+        s.url,
+        m.extracted_foods,
+        s.year AS year_int,
+        s.loaded_at
+    FROM source s
+    INNER JOIN food_matches m
+        ON s.video_id = m.video_id
 )
 
 SELECT * FROM cleaned